@@ -0,0 +1,88 @@
+// Web Worker that runs the batched Hardy first-passage computation off
+// the UI thread, so slider interaction stays responsive at large nMax.
+
+// First-passage pmf to par (the ordinary absorbing state) for every
+// par in `pars`, propagated together inside one shot loop so the
+// interpreter overhead per shot is paid once instead of once per par.
+const hardyFinishPMFBatch = (pars, i, pGood, qBad, maxN = 19) => {
+  // Typed-array results: pmf reads on the render side stay monomorphic
+  // and the structured clone back to the main thread is a flat copy.
+  const nArray = new Int32Array(maxN + 1);
+  for (let n = 0; n <= maxN; n++) nArray[n] = n;
+
+  if (pGood < 0 || qBad < 0 || pGood + qBad >= 1) {
+    return pars.map(parM => ({ parM, nArray: new Int32Array(0), pmf: new Float64Array(0) }));
+  }
+
+  const pOrd = 1 - pGood - qBad;
+
+  // Two Float64Array buffers per par, allocated once and swapped each
+  // shot: unboxed doubles for V8 and no per-shot allocations.
+  const holes = pars.map(parM => {
+    const pmf = new Float64Array(maxN + 1);
+    const pState = new Float64Array(parM);
+    const pNext = new Float64Array(parM);
+    let active = false;
+
+    if (i === parM) {
+      // Already at par: absorbed immediately.
+      pmf[0] = 1.0;
+    } else if (i >= 0 && i <= parM - 1) {
+      pState[i] = 1.0;
+      active = true;
+    }
+    // i === parM + 1 (exceptional) or out of range: pmf stays zero.
+
+    return { parM, pmf, pState, pNext, active };
+  });
+
+  for (let shot = 1; shot <= maxN; shot++) {
+    for (const hole of holes) {
+      if (!hole.active) continue;
+      const { parM, pmf, pState, pNext } = hole;
+      pNext.fill(0);
+
+      for (let s = 0; s < parM; s++) {
+        const probHere = pState[s];
+        // Bad shot (+0) stays put.
+        pNext[s] += probHere * qBad;
+        // Ordinary shot (+1): top state is absorbed exactly at par.
+        if (s + 1 < parM) pNext[s + 1] += probHere * pOrd;
+        else pmf[shot] += probHere * pOrd;
+        // Good shot (+2): s = parM-2 hits par, s = parM-1 overshoots.
+        if (s + 2 < parM) pNext[s + 2] += probHere * pGood;
+        else if (s + 2 === parM) pmf[shot] += probHere * pGood;
+      }
+
+      hole.pState = pNext;
+      hole.pNext = pState;
+    }
+  }
+
+  return holes.map(({ parM, pmf }) => ({ parM, nArray, pmf }));
+};
+
+self.onmessage = (e) => {
+  const { key, p, q, startState, nMax } = e.data;
+
+  const distributions = hardyFinishPMFBatch([3, 4, 5], startState, p, q, nMax).map(({ parM, nArray, pmf }) => {
+    // One pass over pmf for both moments instead of two .reduce scans.
+    let meanShots = 0;
+    let totalProb = 0;
+    for (let k = 0; k < pmf.length; k++) {
+      const v = pmf[k];
+      meanShots += k * v;
+      totalProb += v;
+    }
+
+    return {
+      parM,
+      nArray,
+      pmf,
+      meanShots,
+      totalProb
+    };
+  });
+
+  self.postMessage({ key, distributions });
+};
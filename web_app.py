@@ -1,4 +1,4 @@
-import React, { useState, useMemo } from 'react';
+import React, { useState, useMemo, useRef, useEffect } from 'react';
 import { BarChart, Bar, XAxis, YAxis, CartesianGrid, Tooltip, Legend, ResponsiveContainer } from 'recharts';
 
 const HardyPMFApp = () => {
@@ -7,100 +7,71 @@ const HardyPMFApp = () => {
   const [startState, setStartState] = useState(0);
   const [nMax, setNMax] = useState(15);
 
-  const hardyFinishPMF = (parM, i, j, pGood, qBad, maxN = 19) => {
-    if (pGood < 0 || qBad < 0 || pGood + qBad >= 1) {
-      return { nArray: [], pmf: [] };
-    }
-
-    const pOrd = 1 - pGood - qBad;
-    const nArray = Array.from({ length: maxN + 1 }, (_, i) => i);
-    const pmf = new Array(maxN + 1).fill(0);
-
-    const ordinaryAbs = parM;
-    const exceptionalAbs = parM + 1;
-    const otherAbs = j === exceptionalAbs ? ordinaryAbs : exceptionalAbs;
-
-    if (i === j) {
-      pmf[0] = 1.0;
-      return { nArray, pmf };
-    }
-
-    if (i === otherAbs) {
-      return { nArray, pmf };
-    }
-
-    const pState = new Array(parM).fill(0);
-    if (i >= 0 && i <= parM - 1) {
-      pState[i] = 1.0;
-    } else {
-      return { nArray, pmf };
-    }
-
-    for (let shot = 1; shot <= maxN; shot++) {
-      const pNext = new Array(parM).fill(0);
-
-      for (let s = 0; s < parM; s++) {
-        const probHere = pState[s];
-        if (probHere === 0.0) continue;
-
-        // Good shot: +2
-        let newVal = s + 2;
-        if (newVal >= exceptionalAbs) {
-          if (j === exceptionalAbs) pmf[shot] += probHere * pGood;
-        } else if (newVal === ordinaryAbs) {
-          if (j === ordinaryAbs) pmf[shot] += probHere * pGood;
-        } else {
-          pNext[newVal] += probHere * pGood;
-        }
-
-        // Ordinary shot: +1
-        newVal = s + 1;
-        if (newVal >= exceptionalAbs) {
-          if (j === exceptionalAbs) pmf[shot] += probHere * pOrd;
-        } else if (newVal === ordinaryAbs) {
-          if (j === ordinaryAbs) pmf[shot] += probHere * pOrd;
-        } else {
-          pNext[newVal] += probHere * pOrd;
-        }
-
-        // Bad shot: +0
-        pNext[s] += probHere * qBad;
+  const [distributions, setDistributions] = useState([]);
+
+  // Small LRU cache so dragging a slider back over previously-seen
+  // positions reuses the computed distributions instead of asking the
+  // worker to rerun the Markov chains on every tick.
+  const cacheRef = useRef(new Map());
+  const workerRef = useRef(null);
+  // Key of the most recent slider position; replies for any other key
+  // are stale (a cache hit may already have displayed newer data) and
+  // only go into the cache.
+  const latestKeyRef = useRef('');
+
+  // The Markov computation runs in a Web Worker (hardyWorker.js) so the
+  // UI thread never blocks during slider drags.
+  useEffect(() => {
+    const worker = new Worker(new URL('./hardyWorker.js', import.meta.url));
+    worker.onmessage = (e) => {
+      const { key, distributions } = e.data;
+      const cache = cacheRef.current;
+      cache.set(key, distributions);
+      while (cache.size > 64) {
+        cache.delete(cache.keys().next().value);
       }
-
-      for (let s = 0; s < parM; s++) {
-        pState[s] = pNext[s];
+      if (key === latestKeyRef.current) {
+        setDistributions(distributions);
       }
+    };
+    workerRef.current = worker;
+    return () => worker.terminate();
+  }, []);
+
+  useEffect(() => {
+    const key = `${p.toFixed(2)}|${q.toFixed(2)}|${startState}|${nMax}`;
+    const cache = cacheRef.current;
+    latestKeyRef.current = key;
+
+    if (cache.has(key)) {
+      const hit = cache.get(key);
+      cache.delete(key);
+      cache.set(key, hit);
+      setDistributions(hit);
+      return undefined;
     }
 
-    return { nArray, pmf };
-  };
-
-  const distributions = useMemo(() => {
-    const pars = [3, 4, 5];
-    return pars.map(parM => {
-      const { nArray, pmf } = hardyFinishPMF(parM, startState, parM, p, q, nMax);
-      const meanShots = nArray.reduce((sum, n, idx) => sum + n * pmf[idx], 0);
-      const totalProb = pmf.reduce((sum, prob) => sum + prob, 0);
-
-      return {
-        parM,
-        nArray,
-        pmf,
-        meanShots,
-        totalProb
-      };
-    });
+    // Debounce posts so a fast drag only computes the resting position.
+    const timer = setTimeout(() => {
+      if (workerRef.current) {
+        workerRef.current.postMessage({ key, p, q, startState, nMax });
+      }
+    }, 30);
+    return () => clearTimeout(timer);
   }, [p, q, startState, nMax]);
 
   const chartData = useMemo(() => {
-    const maxLength = Math.max(...distributions.map(d => d.nArray.length));
-    return Array.from({ length: Math.min(maxLength, nMax + 1) }, (_, i) => {
-      const dataPoint = { shots: i };
-      distributions.forEach(d => {
-        dataPoint[`Par ${d.parM}`] = d.pmf[i] || 0;
-      });
-      return dataPoint;
-    });
+    // Fixed-shape rows assigned by index: every row shares one hidden
+    // class in V8, which keeps Recharts' re-renders cheap.
+    const rows = new Array(nMax + 1);
+    for (let i = 0; i <= nMax; i++) {
+      const row = { shots: i, 'Par 3': 0, 'Par 4': 0, 'Par 5': 0 };
+      for (const d of distributions) {
+        row[`Par ${d.parM}`] = d.pmf[i] || 0;
+      }
+      rows[i] = row;
+    }
+    return rows;
   }, [distributions, nMax]);
 
   const isValidParams = p >= 0 && q >= 0 && p + q < 1;
@@ -214,10 +185,10 @@ const HardyPMFApp = () => {
             <div className="grid grid-cols-1 md:grid-cols-3 gap-6">
               {distributions.map((dist, idx) => {
                 const colors = ['#2E86AB', '#A23B72', '#F18F01'];
-                const individualData = dist.nArray.slice(0, nMax + 1).map((n, i) => ({
-                  shots: n,
-                  probability: dist.pmf[i] || 0
-                }));
+                const individualData = new Array(Math.min(dist.nArray.length, nMax + 1));
+                for (let k = 0; k < individualData.length; k++) {
+                  individualData[k] = { shots: dist.nArray[k], probability: dist.pmf[k] || 0 };
+                }
 
                 return (
                   <div key={dist.parM} className="bg-white rounded-lg shadow-lg p-6">